@@ -114,8 +114,7 @@ def main():
     destinations = ["Mannheim", "Duisburg", "Cologne"]
 
     for agent, dest in zip(agents, destinations):
-        agent.set_destination(dest, network)
-        path, distance = network.get_shortest_path(agent.origin, dest)
+        path, distance = agent.set_destination(dest, network)
 
         print(f"{agent.agent_id}: {agent.origin} -> {dest}")
         print(f"  Route: {' -> '.join(path)}")
@@ -132,6 +131,9 @@ def main():
     print("Starting simulation...")
     print()
 
+    # Edge distances for direct (one-hop) lookups during movement
+    edge_distances = {(edge.source, edge.target): edge.weight for edge in routes}
+
     max_steps = 20
     step = 0
 
@@ -143,12 +145,12 @@ def main():
             break
 
         step += 1
-        print(f"Step {step}:")
-        print("-" * 70)
+        # Collect the step's output and write it in one call
+        lines = [f"Step {step}:", "-" * 70]
 
         for agent in agents:
             if agent.is_at_destination:
-                print(f"  {agent.agent_id}: AT DESTINATION ({agent.current_node})")
+                lines.append(f"  {agent.agent_id}: AT DESTINATION ({agent.current_node})")
                 continue
 
             if agent.state == AgentState.TRAVELING and agent.next_node:
@@ -156,16 +158,8 @@ def main():
                 next_node = agent.next_node
                 current = agent.current_node
 
-                # Find edge weight
-                try:
-                    # Get distance from network
-                    path, distance = network.get_shortest_path(current, next_node)
-                    if len(path) == 2:  # Direct edge
-                        edge_distance = distance
-                    else:
-                        edge_distance = 10.0  # Default
-                except:
-                    edge_distance = 10.0
+                # Find edge weight (default if no direct edge)
+                edge_distance = edge_distances.get((current, next_node), 10.0)
 
                 # Calculate travel time (assume 14 km/h average speed)
                 travel_time = edge_distance / 14.0
@@ -176,9 +170,10 @@ def main():
                     time=travel_time
                 )
 
-                print(f"  {agent.agent_id}: {current} -> {agent.current_node} "
-                      f"(+{edge_distance:.0f} km, +{travel_time:.2f} h)")
+                lines.append(f"  {agent.agent_id}: {current} -> {agent.current_node} "
+                             f"(+{edge_distance:.0f} km, +{travel_time:.2f} h)")
 
+        print("\n".join(lines))
         print()
 
     # Final statistics
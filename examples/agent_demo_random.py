@@ -15,12 +15,14 @@ Usage:
 """
 
 import sys
-import random
 import csv
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -29,29 +31,65 @@ from src.models.agent import Agent, AgentState, create_agent, reset_agent_id_cou
 from src.models.traffic import TrafficManager
 from src.assumptions import get_agent_config
 
-
+# Write buffer for CSV exports (time series files can reach millions of rows)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Time series CSV columns
+TIMESERIES_HEADER = (
+    'step',
+    'ship_id',
+    'automation_level',
+    'base_speed_kmh',
+    'effective_speed_kmh',
+    'ris_connected',
+    'current_node',
+    'destination',
+    'state',
+    'distance_traveled_km',
+    'time_elapsed_hours',
+    'waiting_time_hours',
+    'next_node'
+)
+
+# Per-step history columns, in the order they are captured each step
+TIMESERIES_STEP_FIELDS = ('effective_speed', 'distance_traveled', 'time_elapsed',
+                          'waiting_time', 'current_node', 'state', 'next_node')
+TIMESERIES_STEP_DTYPES = (np.float64, np.float64, np.float64,
+                          np.float64, object, np.int8, object)
+
+# Agent states are recorded as small integer codes (index into AGENT_STATES)
+AGENT_STATES = tuple(AgentState)
+STATE_CODES = {state: code for code, state in enumerate(AGENT_STATES)}
+STATE_VALUES = tuple(state.value for state in AGENT_STATES)
+
+# Rhine ports as (id, capacity) rows, upstream order
+RHINE_PORTS = (
+    ("Rotterdam", 470000000),
+    ("Dordrecht", 50000000),
+    ("Nijmegen", 20000000),
+    ("Duisburg", 50000000),
+    ("Cologne", 30000000),
+    ("Mannheim", 25000000),
+)
+
+
+@lru_cache(maxsize=1)
 def create_rhine_network() -> Network:
-    """Create a network representing Rhine river ports."""
+    """
+    Create a network representing Rhine river ports.
+
+    The network is static, so it is built (and its shortest paths
+    precomputed) once and the same instance is returned on every call.
+    Copy it before making changes.
+    """
     network = Network(directed=True)
 
     # Add nodes representing ports
-    ports = [
-        Node(id="Rotterdam", name="Rotterdam Port", node_type="port",
-             properties={"capacity": 470000000}),
-        Node(id="Dordrecht", name="Dordrecht Port", node_type="port",
-             properties={"capacity": 50000000}),
-        Node(id="Nijmegen", name="Nijmegen Port", node_type="port",
-             properties={"capacity": 20000000}),
-        Node(id="Duisburg", name="Duisburg Port", node_type="port",
-             properties={"capacity": 50000000}),
-        Node(id="Cologne", name="Cologne Port", node_type="port",
-             properties={"capacity": 30000000}),
-        Node(id="Mannheim", name="Mannheim Port", node_type="port",
-             properties={"capacity": 25000000}),
-    ]
-
-    for port in ports:
-        network.add_node(port)
+    network.add_nodes(
+        Node(id=port_id, name=f"{port_id} Port", node_type="port",
+             properties={"capacity": capacity})
+        for port_id, capacity in RHINE_PORTS
+    )
 
     # Add edges (shipping routes with distances in km)
     routes = [
@@ -62,17 +100,19 @@ def create_rhine_network() -> Network:
         Edge("Cologne", "Mannheim", weight=143.0, properties={"distance_km": 143}),
         # Alternative route
         Edge("Rotterdam", "Nijmegen", weight=130.0, properties={"distance_km": 130}),
-        # Reverse routes for bidirectional travel
-        Edge("Dordrecht", "Rotterdam", weight=24.0, properties={"distance_km": 24}),
-        Edge("Nijmegen", "Dordrecht", weight=95.0, properties={"distance_km": 95}),
-        Edge("Duisburg", "Nijmegen", weight=111.0, properties={"distance_km": 111}),
-        Edge("Cologne", "Duisburg", weight=60.0, properties={"distance_km": 60}),
-        Edge("Mannheim", "Cologne", weight=143.0, properties={"distance_km": 143}),
-        Edge("Nijmegen", "Rotterdam", weight=130.0, properties={"distance_km": 130}),
     ]
 
-    for route in routes:
-        network.add_edge(route)
+    # Reverse routes for bidirectional travel. Kept as separate directed
+    # edges: traffic and crossroads are tracked per direction.
+    network.add_edges(routes)
+    network.add_edges(
+        Edge(route.target, route.source, weight=route.weight,
+             properties=dict(route.properties))
+        for route in routes
+    )
+
+    # Network is static from here on; route planning reuses these paths
+    network.precompute_shortest_paths()
 
     return network
 
@@ -80,49 +120,68 @@ def create_rhine_network() -> Network:
 def create_random_ships(
     num_ships: int,
     port_ids: List[str],
-    network: Network
+    network: Network,
+    rng: Optional[np.random.Generator] = None
 ) -> List[Agent]:
     """
     Create random ships with random start/destination and automation levels.
 
+    All random attributes are drawn in one batch per attribute from a single
+    NumPy generator; the Python loop only creates the agents.
+
     Args:
         num_ships: Number of ships to create
         port_ids: List of available port IDs
         network: Network for route planning
+        rng: NumPy random generator (a fresh unseeded one if None)
 
     Returns:
         List of Agent objects
     """
     reset_agent_id_counter()
 
+    if rng is None:
+        rng = np.random.default_rng()
+
     # Load agent configuration from assumptions
     agent_config = get_agent_config()
     speed_min, speed_max = agent_config["vessel_speed_range_kmh"]
     ris_probs = agent_config["ris_connectivity_by_level"]
 
-    ships = []
+    # Random start locations
+    starts = rng.integers(0, len(port_ids), num_ships)
 
-    for i in range(num_ships):
-        # Random start location
-        start = random.choice(port_ids)
+    # Random destinations (different from start): draw from the other
+    # len(port_ids) - 1 ports and shift indices at or above the start
+    destinations = rng.integers(0, len(port_ids) - 1, num_ships)
+    destinations += destinations >= starts
 
-        # Random destination (different from start)
-        available_destinations = [p for p in port_ids if p != start]
-        destination = random.choice(available_destinations)
+    # Random automation levels (0-5)
+    automation_levels = rng.integers(0, 6, num_ships)
 
-        # Random automation level (0-5)
-        automation_level = random.randint(0, 5)
+    # Random speeds from configured range
+    speeds = rng.uniform(speed_min, speed_max, num_ships)
 
-        # Random speed from configured range
-        speed = random.uniform(speed_min, speed_max)
+    # RIS connectivity based on automation level (from assumptions),
+    # looked up in a per-level probability table indexed by level 0-5
+    ris_table = np.array([
+        ris_probs["L0_L2"], ris_probs["L0_L2"], ris_probs["L0_L2"],
+        ris_probs["L3_L4"], ris_probs["L3_L4"],
+        ris_probs["L5"],
+    ])
+    ris_thresholds = ris_table[automation_levels]
+    ris_connected = rng.random(num_ships) < ris_thresholds
 
-        # RIS connectivity based on automation level (from assumptions)
-        if automation_level <= 2:
-            ris_connected = random.random() < ris_probs["L0_L2"]
-        elif automation_level <= 4:
-            ris_connected = random.random() < ris_probs["L3_L4"]
-        else:
-            ris_connected = random.random() < ris_probs["L5"]
+    ships = []
+
+    for start_i, destination_i, automation_level, speed, ris in zip(
+        starts.tolist(),
+        destinations.tolist(),
+        automation_levels.tolist(),
+        speeds.tolist(),
+        ris_connected.tolist()
+    ):
+        start = port_ids[start_i]
 
         # Create agent
         ship = create_agent(
@@ -131,12 +190,12 @@ def create_random_ships(
             start,
             automation_level=automation_level,
             speed=speed,
-            ris_connected=ris_connected
+            ris_connected=ris
         )
 
         # Set destination
         try:
-            ship.set_destination(destination, network)
+            ship.set_destination(port_ids[destination_i], network)
             ships.append(ship)
         except ValueError:
             # Skip if no path exists
@@ -144,6 +203,20 @@ def create_random_ships(
 
     return ships
 
+def _results_filepath(filename: Optional[str], prefix: str) -> Path:
+    """Return a path in the results directory, timestamping the name if not given."""
+    # Create results directory if it doesn't exist
+    results_dir = Path(__file__).parent.parent / "results"
+    results_dir.mkdir(exist_ok=True)
+
+    # Generate filename if not provided
+    if filename is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{prefix}_{timestamp}.csv"
+
+    return results_dir / filename
+
+
 def export_ships_to_csv(ships: List[Agent], metrics: dict, filename: str = None) -> str:
     """
     Export ship data to CSV file.
@@ -156,19 +229,11 @@ def export_ships_to_csv(ships: List[Agent], metrics: dict, filename: str = None)
     Returns:
         Path to created CSV file
     """
-    # Create results directory if it doesn't exist
-    results_dir = Path(__file__).parent.parent / "results"
-    results_dir.mkdir(exist_ok=True)
-
-    # Generate filename if not provided
-    if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"ship_simulation_{timestamp}.csv"
-
-    filepath = results_dir / filename
+    filepath = _results_filepath(filename, "ship_simulation")
 
     # Write CSV
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+    with open(filepath, 'w', newline='', encoding='utf-8',
+              buffering=CSV_BUFFER_SIZE) as f:
         writer = csv.writer(f)
 
         # Header
@@ -188,9 +253,8 @@ def export_ships_to_csv(ships: List[Agent], metrics: dict, filename: str = None)
         ])
 
         # Ship data
-        for ship in ships:
-            total_time = ship.journey_time + ship.waiting_time
-            writer.writerow([
+        writer.writerows(
+            (
                 ship.agent_id,
                 ship.automation_level,
                 f"{ship.speed:.2f}",
@@ -200,85 +264,100 @@ def export_ships_to_csv(ships: List[Agent], metrics: dict, filename: str = None)
                 f"{ship.journey_distance:.2f}",
                 f"{ship.journey_time:.2f}",
                 f"{ship.waiting_time:.2f}",
-                f"{total_time:.2f}",
+                f"{ship.journey_time + ship.waiting_time:.2f}",
                 ship.state.value,
                 ' -> '.join(ship.route)
-            ])
+            )
+            for ship in ships
+        )
 
     return str(filepath)
 
 
-def export_timeseries_to_csv(history: List[dict], filename: str = None) -> str:
+def open_timeseries_csv(filename: str = None):
     """
-    Export simulation time series data to CSV file.
+    Open a time series CSV file for streaming and write its header.
 
     Args:
-        history: List of step snapshots with ship states
         filename: Optional filename (auto-generated if None)
 
     Returns:
-        Path to created CSV file
+        Tuple of (open file, csv writer, path). The caller closes the file.
     """
-    # Create results directory if it doesn't exist
-    results_dir = Path(__file__).parent.parent / "results"
-    results_dir.mkdir(exist_ok=True)
+    filepath = _results_filepath(filename, "ship_timeseries")
+    f = open(filepath, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
+    writer = csv.writer(f)
+    writer.writerow(TIMESERIES_HEADER)
+    return f, writer, str(filepath)
 
-    # Generate filename if not provided
-    if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"ship_timeseries_{timestamp}.csv"
 
-    filepath = results_dir / filename
-
-    # Write CSV
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
+def export_timeseries_to_csv(history: Dict[str, np.ndarray], filename: str = None) -> str:
+    """
+    Export simulation time series data to CSV file.
 
-        # Header
-        writer.writerow([
-            'step',
-            'ship_id',
-            'automation_level',
-            'base_speed_kmh',
-            'effective_speed_kmh',
-            'ris_connected',
-            'current_node',
-            'destination',
-            'state',
-            'distance_traveled_km',
-            'time_elapsed_hours',
-            'waiting_time_hours',
-            'next_node'
-        ])
+    Args:
+        history: Columnar history from run_simulation (per-ship and per-step arrays)
+        filename: Optional filename (auto-generated if None)
 
+    Returns:
+        Path to created CSV file
+    """
+    f, writer, filepath = open_timeseries_csv(filename)
+    with f:
         # Time series data
-        for step_data in history:
-            step = step_data['step']
-            for ship_state in step_data['ships']:
-                writer.writerow([
-                    step,
-                    ship_state['ship_id'],
-                    ship_state['automation_level'],
-                    f"{ship_state['base_speed']:.2f}",
-                    f"{ship_state['effective_speed']:.2f}",
-                    ship_state['ris_connected'],
-                    ship_state['current_node'],
-                    ship_state['destination'],
-                    ship_state['state'],
-                    f"{ship_state['distance_traveled']:.2f}",
-                    f"{ship_state['time_elapsed']:.2f}",
-                    f"{ship_state['waiting_time']:.2f}",
-                    ship_state['next_node'] or ''
-                ])
-
-    return str(filepath)
+        writer.writerows(_timeseries_rows(history))
+
+    return filepath
+
+
+def _timeseries_rows(history: Dict[str, np.ndarray]):
+    """Yield one CSV row per ship per step from the columnar history."""
+    # Per-ship columns are constant over the run
+    static = list(zip(
+        history['ship_id'].tolist(),
+        history['automation_level'].tolist(),
+        history['base_speed'].tolist(),
+        history['ris_connected'].tolist(),
+        history['destination'].tolist()
+    ))
+
+    for row in range(history['effective_speed'].shape[0]):
+        columns = [history[field][row].tolist() for field in TIMESERIES_STEP_FIELDS]
+        yield from _step_rows(row + 1, static, columns)
+
+
+def _step_rows(step: int, static: List[tuple], columns: List[list]):
+    """Yield the CSV rows for one step, given per-ship values in TIMESERIES_STEP_FIELDS order."""
+    # Calling the float.__format__ method descriptor directly skips f-string
+    # dispatch. It only accepts floats (an int raises TypeError), which holds
+    # because every formatted column comes from numpy .tolist() or float math.
+    fmt = float.__format__
+    for (ship_id, level, base_speed, ris, destination), effective_speed, distance, \
+            time_elapsed, waiting, current_node, state, next_node in zip(static, *columns):
+        yield (
+            step,
+            ship_id,
+            level,
+            fmt(base_speed, '.2f'),
+            fmt(effective_speed, '.2f'),
+            ris,
+            current_node,
+            destination,
+            STATE_VALUES[state],
+            fmt(distance, '.2f'),
+            fmt(time_elapsed, '.2f'),
+            fmt(waiting, '.2f'),
+            next_node or ''
+        )
 
 
 def run_simulation(
     num_ships: int = 10,
     max_steps: int = 100,
-    seed: int = None
-) -> Tuple[List[Agent], dict, List[dict]]:
+    seed: int = None,
+    timeseries_writer=None,
+    record_history: bool = True
+) -> Tuple[List[Agent], dict, Optional[Dict[str, np.ndarray]]]:
     """
     Run the complete simulation with realistic traffic behavior.
 
@@ -286,19 +365,28 @@ def run_simulation(
         num_ships: Number of ships to simulate
         max_steps: Maximum simulation steps
         seed: Random seed for reproducibility
+        timeseries_writer: Optional csv writer (see open_timeseries_csv).
+            If given, each step's time series rows are written as soon as
+            the step completes instead of being kept in memory.
+        record_history: Whether to keep the per-step history in memory when
+            not streaming. Set to False for runs that only need the metrics.
 
     Returns:
-        Tuple of (agents list, metrics dict, history list)
+        Tuple of (agents list, metrics dict, history dict). History is
+        columnar: per-ship arrays of length n_ships and per-step arrays of
+        shape (steps, n_ships), row i holding the state after step i + 1.
+        The state column holds int8 codes indexing AGENT_STATES.
+        History is None when streaming to timeseries_writer or when
+        record_history is False.
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     # Create network
     network = create_rhine_network()
     port_ids = list(network.nodes.keys())
 
     # Create ships
-    ships = create_random_ships(num_ships, port_ids, network)
+    ships = create_random_ships(num_ships, port_ids, network, rng)
 
     # Initialize traffic manager
     traffic_mgr = TrafficManager(network)
@@ -308,60 +396,88 @@ def run_simulation(
     total_travel_time = 0.0  # Actual travel time
     total_waiting_time = 0.0  # Total waiting time
 
-    # Track when ships enter/exit
+    # Track when ships exit, keyed by ship index
     ship_exit_step = {}
 
-    # Track history for time series export
-    history = []
+    n_ships = len(ships)
+    if timeseries_writer is not None:
+        # Streaming: only the per-ship columns are kept
+        history = None
+        static = [
+            (ship.agent_id, ship.automation_level, ship.speed, ship.ris_connected,
+             ship.destination)
+            for ship in ships
+        ]
+    elif not record_history:
+        # Metrics only: no per-step state is captured
+        history = None
+    else:
+        # Track history for time series export as column arrays
+        history = {
+            'ship_id': np.array([ship.agent_id for ship in ships], dtype=object),
+            'automation_level': np.array([ship.automation_level for ship in ships], dtype=np.int8),
+            'base_speed': np.array([ship.speed for ship in ships], dtype=np.float64),
+            'ris_connected': np.array([ship.ris_connected for ship in ships], dtype=bool),
+            'destination': np.array([ship.destination for ship in ships], dtype=object),
+        }
+        # Per-step values are collected per field and stacked once the run
+        # ends, so memory tracks the steps actually run rather than max_steps
+        step_history = {field: [] for field in TIMESERIES_STEP_FIELDS}
+
+    # Effective speed per ship, by ship index (base speed until the ship first moves)
+    effective_speeds = np.array([ship.speed for ship in ships], dtype=np.float64)
 
-    # Track effective speeds for each ship at each step
-    ship_effective_speeds = {}
+    # Direct edge distances keyed by (source, target); the network is static
+    edge_distances = {(edge.source, edge.target): edge.weight for edge in network.edges}
+
+    # Crossroad lookup table (fixed for the run)
+    crossroads = traffic_mgr.crossroads
+
+    # Running total of journey + waiting time over all ships, for the fleet average
+    total_ship_time = sum(ship.journey_time + ship.waiting_time for ship in ships)
+
+    # Enum member used in the movement loop's identity check
+    TRAVELING = AgentState.TRAVELING
 
     # Run simulation
     step = 0
-    active_ships = set(ship.agent_id for ship in ships)
+    alive = np.ones(n_ships, dtype=bool)  # Ships that have not yet arrived
 
-    while step < max_steps and active_ships:
+    while step < max_steps and alive.any():
         step += 1
 
         # Move all active ships
-        for ship in ships:
-            if ship.agent_id not in active_ships:
-                continue
+        for i in np.flatnonzero(alive).tolist():
+            ship = ships[i]
+            agent_id = ship.agent_id
+            next_node = ship.next_node  # property; read once
 
             # Move ship if traveling
-            if ship.state == AgentState.TRAVELING and ship.next_node:
+            if ship.state is TRAVELING and next_node:
                 current = ship.current_node
-                next_node = ship.next_node
 
                 # Check crossroad entry (if arriving at next node)
-                can_enter, wait_time = traffic_mgr.check_crossroad_entry(ship.agent_id, next_node)
+                can_enter, wait_time = traffic_mgr.check_crossroad_entry(agent_id, next_node)
 
                 if not can_enter:
                     # Must wait at crossroad
                     ship.waiting_time += wait_time
+                    total_ship_time += wait_time
                     traffic_mgr.update_time(ship.journey_time + ship.waiting_time)
-                    ship_effective_speeds[ship.agent_id] = 0.0
+                    effective_speeds[i] = 0.0
                     continue
 
-                # Get edge distance
-                try:
-                    path, distance = network.get_shortest_path(current, next_node)
-                    if len(path) == 2:
-                        edge_distance = distance
-                    else:
-                        edge_distance = 10.0
-                except:
-                    edge_distance = 10.0
+                # Get edge distance (default if no direct edge)
+                edge_distance = edge_distances.get((current, next_node), 10.0)
 
                 # Register vessel entering edge
-                traffic_mgr.vessel_enter_edge(ship.agent_id, current, next_node)
+                traffic_mgr.vessel_enter_edge(agent_id, current, next_node)
 
                 # Calculate effective speed based on congestion
                 effective_speed = traffic_mgr.get_effective_speed(
-                    ship.agent_id, ship.speed, current, next_node
+                    agent_id, ship.speed, current, next_node
                 )
-                ship_effective_speeds[ship.agent_id] = effective_speed
+                effective_speeds[i] = effective_speed
 
                 # Calculate travel time using effective speed
                 travel_time = edge_distance / effective_speed
@@ -371,65 +487,63 @@ def run_simulation(
                     distance=edge_distance,
                     time=travel_time
                 )
+                total_ship_time += travel_time
 
                 # Register vessel exiting previous edge
-                traffic_mgr.vessel_exit_edge(ship.agent_id, current, next_node)
+                traffic_mgr.vessel_exit_edge(agent_id, current, next_node)
 
                 # Occupy crossroad if arriving at one
-                if next_node in traffic_mgr.crossroads:
-                    traffic_mgr.occupy_crossroad(ship.agent_id, next_node)
+                if next_node in crossroads:
+                    traffic_mgr.occupy_crossroad(agent_id, next_node)
 
                 # Release previous crossroad if leaving one
-                if current in traffic_mgr.crossroads:
-                    traffic_mgr.release_crossroad(ship.agent_id, current)
+                if current in crossroads:
+                    traffic_mgr.release_crossroad(agent_id, current)
 
             # Check if ship reached destination
-            if ship.is_at_destination and ship.agent_id in active_ships:
-                ship_exit_step[ship.agent_id] = step
-                active_ships.remove(ship.agent_id)
+            if ship.is_at_destination:
+                ship_exit_step[i] = step
+                alive[i] = False
 
                 # Release crossroad if at one
-                if ship.current_node in traffic_mgr.crossroads:
-                    traffic_mgr.release_crossroad(ship.agent_id, ship.current_node)
+                if ship.current_node in crossroads:
+                    traffic_mgr.release_crossroad(agent_id, ship.current_node)
 
         # Update traffic manager time
         if ships:
-            avg_time = sum(s.journey_time + s.waiting_time for s in ships) / len(ships)
-            traffic_mgr.update_time(avg_time)
+            traffic_mgr.update_time(total_ship_time / n_ships)
+
+        if history is None and timeseries_writer is None:
+            continue
 
         # Capture state after all movements for this step
-        step_snapshot = {
-            'step': step,
-            'ships': []
-        }
+        # (one list per field, in TIMESERIES_STEP_FIELDS order)
+        columns = [
+            effective_speeds.tolist(),
+            [ship.journey_distance for ship in ships],
+            [ship.journey_time for ship in ships],
+            [ship.waiting_time for ship in ships],
+            [ship.current_node for ship in ships],
+            [STATE_CODES[ship.state] for ship in ships],
+            [ship.next_node for ship in ships],
+        ]
+        if history is None:
+            timeseries_writer.writerows(_step_rows(step, static, columns))
+        else:
+            for field, values in zip(TIMESERIES_STEP_FIELDS, columns):
+                step_history[field].append(values)
 
-        for ship in ships:
-            eff_speed = ship_effective_speeds.get(ship.agent_id, ship.speed)
-            step_snapshot['ships'].append({
-                'ship_id': ship.agent_id,
-                'automation_level': ship.automation_level,
-                'base_speed': ship.speed,
-                'effective_speed': eff_speed,
-                'ris_connected': ship.ris_connected,
-                'current_node': ship.current_node,
-                'destination': ship.destination,
-                'state': ship.state.value,
-                'distance_traveled': ship.journey_distance,
-                'time_elapsed': ship.journey_time,
-                'waiting_time': ship.waiting_time,
-                'next_node': ship.next_node
-            })
-
-        # Save step snapshot to history
-        history.append(step_snapshot)
+    if history is not None:
+        for field, dtype in zip(TIMESERIES_STEP_FIELDS, TIMESERIES_STEP_DTYPES):
+            history[field] = np.array(step_history[field], dtype=dtype).reshape(step, n_ships)
 
     # Calculate metrics
-    for ship in ships:
+    for i, ship in enumerate(ships):
         total_travel_time += ship.journey_time
         total_waiting_time += ship.waiting_time
 
         # System time = travel time + waiting time
-        if ship.agent_id in ship_exit_step:
+        if i in ship_exit_step:
             total_system_time += (ship.journey_time + ship.waiting_time)
 
     metrics = {
@@ -496,12 +610,15 @@ def main(
     print("=" * 80)
     print()
 
-    # Run simulation
-    ships, metrics, history = run_simulation(
-        num_ships=num_ships,
-        max_steps=200,
-        seed=seed
-    )
+    # Run simulation, streaming the time series straight to CSV
+    timeseries_file, timeseries_writer, timeseries_path = open_timeseries_csv()
+    with timeseries_file:
+        ships, metrics, _ = run_simulation(
+            num_ships=num_ships,
+            max_steps=200,
+            seed=seed,
+            timeseries_writer=timeseries_writer
+        )
 
     # Display results
     print("=" * 80)
@@ -509,14 +626,14 @@ def main(
     print("=" * 80)
     print()
 
-    # Group by automation level
-    by_automation = {}
-    for ship in ships:
-        level = ship.automation_level
-        by_automation[level] = by_automation.get(level, 0) + 1
+    # Group by automation level (0-5)
+    level_counts = np.bincount(
+        np.fromiter((ship.automation_level for ship in ships), dtype=np.int64, count=len(ships)),
+        minlength=6
+    )
 
-    for level in sorted(by_automation.keys()):
-        print(f"  Level {level}: {by_automation[level]} ships")
+    for level in np.flatnonzero(level_counts).tolist():
+        print(f"  Level {level}: {level_counts[level]} ships")
 
     print()
 
@@ -570,7 +687,6 @@ def main(
     csv_path = export_ships_to_csv(ships, metrics)
     print(f"Ship summary exported to: {csv_path}")
 
-    timeseries_path = export_timeseries_to_csv(history)
     print(f"Time series data exported to: {timeseries_path}")
     print()
 
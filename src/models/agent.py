@@ -12,7 +12,7 @@ explicit attributes.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 from src.models.network import Network
 from src.assumptions import get_agent_config
@@ -101,7 +101,11 @@ class Agent:
             if self.current_node not in self.route or self.route[0] != self.current_node:
                 pass  # Don't auto-insert, respect provided route
 
-    def set_destination(self, destination: str, network: Network) -> None:
+    def set_destination(
+        self,
+        destination: str,
+        network: Network
+    ) -> Tuple[List[str], float]:
         """
         Set a destination and plan route through network.
 
@@ -109,6 +113,10 @@ class Agent:
             destination: Target node ID
             network: Network to navigate
 
+        Returns:
+            Tuple of (copy of the planned route as list of node IDs,
+            total route length)
+
         Raises:
             ValueError: If no path exists to destination
         """
@@ -126,6 +134,8 @@ class Agent:
         except ValueError as e:
             raise ValueError(f"Cannot plan route for agent {self.agent_id}: {e}")
 
+        return list(path), distance
+
     @property
     def next_node(self) -> Optional[str]:
         """Get the next node in the route."""
@@ -6,7 +6,7 @@ agent-based modeling applications.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 import networkx as nx
 
 
@@ -77,6 +77,8 @@ class Network:
         self._graph = nx.DiGraph() if directed else nx.Graph()
         self._nodes: Dict[str, Node] = {}
         self._edges: List[Edge] = []
+        # Shortest paths keyed by (source, target, weight attribute)
+        self._path_cache: Dict[Tuple[str, str, str], Tuple[List[str], float]] = {}
 
     def add_node(self, node: Node) -> None:
         """
@@ -117,6 +119,68 @@ class Network:
             **edge.properties
         )
 
+        # New edges can shorten existing paths
+        self._path_cache.clear()
+
+    def add_nodes(self, nodes: Iterable[Node]) -> None:
+        """
+        Add several nodes to the network in one call.
+
+        Nodes are inserted into the graph in bulk. If any ID is already
+        present (or repeated within nodes), nothing is added.
+
+        Args:
+            nodes: Node objects to add
+
+        Raises:
+            ValueError: If a node with the same ID already exists
+        """
+        nodes = list(nodes)
+        seen = set()
+        for node in nodes:
+            if node.id in self._nodes or node.id in seen:
+                raise ValueError(f"Node with id '{node.id}' already exists")
+            seen.add(node.id)
+
+        for node in nodes:
+            self._nodes[node.id] = node
+        self._graph.add_nodes_from((node.id, node.properties) for node in nodes)
+
+    def add_edges(self, edges: Iterable[Edge]) -> None:
+        """
+        Add several edges to the network in one call.
+
+        Edges are inserted into the graph in bulk and the shortest-path
+        cache is cleared once. If any edge refers to a missing node,
+        nothing is added.
+
+        Args:
+            edges: Edge objects to add
+
+        Raises:
+            ValueError: If source or target node doesn't exist
+            TypeError: If an edge's properties contain a 'weight' key
+        """
+        edges = list(edges)
+        for edge in edges:
+            if edge.source not in self._nodes:
+                raise ValueError(f"Source node '{edge.source}' does not exist")
+            if edge.target not in self._nodes:
+                raise ValueError(f"Target node '{edge.target}' does not exist")
+
+        # dict() rejects a 'weight' key in properties with the same
+        # TypeError as add_edge(), before anything is added
+        attributes = [dict(weight=edge.weight, **edge.properties) for edge in edges]
+
+        self._edges.extend(edges)
+        self._graph.add_edges_from(
+            (edge.source, edge.target, attrs)
+            for edge, attrs in zip(edges, attributes)
+        )
+
+        # New edges can shorten existing paths
+        self._path_cache.clear()
+
     def get_node(self, node_id: str) -> Optional[Node]:
         """
         Get a node by its ID.
@@ -156,6 +220,9 @@ class Network:
         """
         Find shortest path between two nodes.
 
+        Results are cached per (source, target, weight) until the next
+        add_edge() call, so repeated queries on a static network are O(1).
+
         Args:
             source: Source node ID
             target: Target node ID
@@ -172,22 +239,60 @@ class Network:
         if target not in self._nodes:
             raise ValueError(f"Target node '{target}' does not exist")
 
+        cached = self._path_cache.get((source, target, weight))
+        if cached is not None:
+            path, length = cached
+            return list(path), length
+
         try:
-            path = nx.shortest_path(
-                self._graph,
-                source=source,
-                target=target,
-                weight=weight
-            )
-            length = nx.shortest_path_length(
+            path, length = self._compute_shortest_path(source, target, weight)
+        except nx.NetworkXNoPath:
+            raise ValueError(f"No path exists between '{source}' and '{target}'")
+
+        return list(path), length
+
+    def _compute_shortest_path(
+        self,
+        source: str,
+        target: str,
+        weight: str
+    ) -> Tuple[List[str], float]:
+        """Run the shortest-path query and store the result in the cache."""
+        # One search per pair, using the same algorithms as nx.shortest_path
+        # so ties between equal-length routes resolve the same way
+        if weight is None:
+            path = nx.bidirectional_shortest_path(self._graph, source, target)
+            length = len(path) - 1
+        else:
+            length, path = nx.bidirectional_dijkstra(
                 self._graph,
-                source=source,
-                target=target,
+                source,
+                target,
                 weight=weight
             )
-            return path, length
-        except nx.NetworkXNoPath:
-            raise ValueError(f"No path exists between '{source}' and '{target}'")
+        self._path_cache[(source, target, weight)] = (path, length)
+        return path, length
+
+    def precompute_shortest_paths(self, weight: str = "weight") -> None:
+        """
+        Compute and cache shortest paths between all reachable node pairs.
+
+        get_shortest_path() caches results on demand; this fills the cache
+        up front for every reachable pair. Each pair runs the same search as
+        an on-demand call, so paths between equal-length alternatives are
+        chosen identically. That is one search per reachable pair (O(V^2)
+        searches), which is much slower than a single all-pairs pass on
+        large networks; only use it when most pairs will be queried. The
+        cache is cleared whenever an edge is added, so this should be
+        called once the network is fully built.
+
+        Args:
+            weight: Edge attribute to use as weight (default: 'weight')
+        """
+        for source in self._nodes:
+            for target in nx.descendants(self._graph, source) | {source}:
+                if (source, target, weight) not in self._path_cache:
+                    self._compute_shortest_path(source, target, weight)
 
     def get_all_paths(
         self,
@@ -278,14 +383,16 @@ class Network:
         subgraph = Network(directed=self.directed)
 
         # Add nodes
-        for node_id in node_ids:
-            if node_id in self._nodes:
-                subgraph.add_node(self._nodes[node_id])
+        subgraph.add_nodes(
+            self._nodes[node_id] for node_id in node_ids if node_id in self._nodes
+        )
 
-        # Add edges that connect nodes in subgraph
-        for edge in self._edges:
-            if edge.source in node_ids and edge.target in node_ids:
-                subgraph.add_edge(edge)
+        # Add edges that connect nodes in subgraph (dict membership, not list scans)
+        kept = subgraph._nodes
+        subgraph.add_edges(
+            edge for edge in self._edges
+            if edge.source in kept and edge.target in kept
+        )
 
         return subgraph
 
@@ -332,24 +439,26 @@ class Network:
         network = cls(directed=data.get('directed', True))
 
         # Add nodes
-        for node_data in data.get('nodes', []):
-            node = Node(
+        network.add_nodes(
+            Node(
                 id=node_data['id'],
                 name=node_data['name'],
                 node_type=node_data.get('type', 'default'),
                 properties=node_data.get('properties', {})
             )
-            network.add_node(node)
+            for node_data in data.get('nodes', [])
+        )
 
         # Add edges
-        for edge_data in data.get('edges', []):
-            edge = Edge(
+        network.add_edges(
+            Edge(
                 source=edge_data['source'],
                 target=edge_data['target'],
                 weight=edge_data.get('weight', 1.0),
                 properties=edge_data.get('properties', {})
             )
-            network.add_edge(edge)
+            for edge_data in data.get('edges', [])
+        )
 
         return network
 
@@ -151,6 +151,8 @@ class TrafficManager:
         """
         self.network = network
         self.edge_traffic: Dict[str, EdgeTraffic] = {}
+        # Same EdgeTraffic objects keyed by (source, target) for per-step lookups
+        self._edge_index: Dict[Tuple[str, str], EdgeTraffic] = {}
         self.crossroads: Dict[str, CrossroadState] = {}
         self.current_time: float = 0.0
 
@@ -167,22 +169,25 @@ class TrafficManager:
             distance = edge.properties.get("distance_km", edge.weight)
             capacity = int(distance * VESSELS_PER_KM_CAPACITY)
 
-            self.edge_traffic[edge_id] = EdgeTraffic(
+            traffic = EdgeTraffic(
                 edge_id=edge_id,
                 distance_km=distance,
                 capacity=capacity
             )
+            self.edge_traffic[edge_id] = traffic
+            self._edge_index[(edge.source, edge.target)] = traffic
 
     def _initialize_crossroads(self):
         """Identify nodes that are crossroads (3+ connections)."""
-        for node_id, node in self.network.nodes.items():
-            # Count incoming and outgoing edges
-            incoming = sum(1 for e in self.network.edges if e.target == node_id)
-            outgoing = sum(1 for e in self.network.edges if e.source == node_id)
-            total_connections = incoming + outgoing
+        # Count incoming and outgoing edges for all nodes in one pass
+        connections = defaultdict(int)
+        for edge in self.network.edges:
+            connections[edge.source] += 1
+            connections[edge.target] += 1
 
+        for node_id in self.network.nodes:
             # Crossroad if 3+ connections
-            if total_connections >= 3:
+            if connections.get(node_id, 0) >= 3:
                 self.crossroads[node_id] = CrossroadState(node_id=node_id)
 
     def vessel_enter_edge(self, agent_id: str, source: str, target: str):
@@ -194,9 +199,9 @@ class TrafficManager:
             source: Source node
             target: Target node
         """
-        edge_id = f"{source}->{target}"
-        if edge_id in self.edge_traffic:
-            self.edge_traffic[edge_id].vessels.add(agent_id)
+        traffic = self._edge_index.get((source, target))
+        if traffic is not None:
+            traffic.vessels.add(agent_id)
 
     def vessel_exit_edge(self, agent_id: str, source: str, target: str):
         """
@@ -207,9 +212,9 @@ class TrafficManager:
             source: Source node
             target: Target node
         """
-        edge_id = f"{source}->{target}"
-        if edge_id in self.edge_traffic:
-            self.edge_traffic[edge_id].vessels.discard(agent_id)
+        traffic = self._edge_index.get((source, target))
+        if traffic is not None:
+            traffic.vessels.discard(agent_id)
 
     def get_effective_speed(self, agent_id: str, base_speed: float,
                            source: str, target: str) -> float:
@@ -225,9 +230,9 @@ class TrafficManager:
         Returns:
             Effective speed in km/h
         """
-        edge_id = f"{source}->{target}"
-        if edge_id in self.edge_traffic:
-            return self.edge_traffic[edge_id].calculate_effective_speed(base_speed)
+        traffic = self._edge_index.get((source, target))
+        if traffic is not None:
+            return traffic.calculate_effective_speed(base_speed)
         return base_speed
 
     def check_crossroad_entry(self, agent_id: str, node_id: str) -> Tuple[bool, float]:
@@ -125,6 +125,25 @@ class TestAgent:
         assert agent.route == ["A", "B", "C"]  # Shortest path
         assert agent.state == AgentState.TRAVELING
 
+    def test_set_destination_returns_planned_route(self, sample_network):
+        """Test that set_destination returns the planned path and its length."""
+        agent = Agent(
+            agent_id="agent1",
+            agent_type="vessel",
+            current_node="A",
+            origin="A"
+        )
+
+        path, distance = agent.set_destination("C", sample_network)
+
+        assert path == ["A", "B", "C"]
+        assert path == agent.route
+        assert path is not agent.route
+        assert distance == 25.0
+
+        path.append("Z")
+        assert agent.route == ["A", "B", "C"]
+
     def test_set_destination_no_path_raises_error(self):
         """Test that setting unreachable destination raises error."""
         network = Network()
@@ -148,6 +148,62 @@ class TestNetwork:
         with pytest.raises(ValueError, match="does not exist"):
             empty_network.add_edge(edge)
 
+    def test_add_nodes_and_edges_in_bulk(self, empty_network):
+        """Test bulk insertion matches one-at-a-time insertion."""
+        empty_network.add_nodes([
+            Node(id="A", name="Node A", properties={"capacity": 100}),
+            Node(id="B", name="Node B"),
+            Node(id="C", name="Node C"),
+        ])
+        empty_network.add_edges([
+            Edge(source="A", target="B", weight=10.0, properties={"distance_km": 10}),
+            Edge(source="B", target="C", weight=15.0),
+        ])
+
+        assert empty_network.node_count == 3
+        assert empty_network.edge_count == 2
+        assert empty_network.get_node("A").properties == {"capacity": 100}
+        assert empty_network.get_neighbors("A") == ["B"]
+        assert empty_network.get_shortest_path("A", "C") == (["A", "B", "C"], 25.0)
+        assert empty_network.get_shortest_path("A", "B", weight="distance_km") == (["A", "B"], 10)
+
+    def test_add_nodes_with_duplicate_adds_nothing(self, sample_network):
+        """Test that a duplicate ID in a bulk add rejects the whole batch."""
+        with pytest.raises(ValueError, match="already exists"):
+            sample_network.add_nodes([Node(id="D", name="Node D"), Node(id="A", name="Node A")])
+
+        assert sample_network.get_node("D") is None
+        assert sample_network.node_count == 3
+
+    def test_add_edges_with_missing_node_adds_nothing(self, sample_network):
+        """Test that a missing endpoint in a bulk add rejects the whole batch."""
+        with pytest.raises(ValueError, match="does not exist"):
+            sample_network.add_edges([Edge(source="C", target="A"), Edge(source="C", target="Z")])
+
+        assert sample_network.edge_count == 3
+        assert "A" not in sample_network.get_neighbors("C")
+
+    def test_add_edges_rejects_weight_property_like_add_edge(self, sample_network):
+        """Test that a 'weight' property raises in bulk adds just as in add_edge."""
+        edge = Edge(source="C", target="A", weight=5.0, properties={"weight": 99})
+
+        with pytest.raises(TypeError):
+            sample_network.add_edges([Edge(source="C", target="B"), edge])
+
+        assert sample_network.edge_count == 3
+        assert sample_network.get_neighbors("C") == []
+
+        with pytest.raises(TypeError):
+            sample_network.add_edge(edge)
+
+    def test_add_edges_clears_path_cache(self, sample_network):
+        """Test that bulk edge insertion invalidates cached shortest paths."""
+        assert sample_network.get_shortest_path("A", "C") == (["A", "B", "C"], 25.0)
+
+        sample_network.add_edges([Edge(source="A", target="C", weight=5.0)])
+
+        assert sample_network.get_shortest_path("A", "C") == (["A", "C"], 5.0)
+
     def test_get_node(self, sample_network):
         """Test retrieving nodes."""
         node = sample_network.get_node("A")
@@ -203,6 +259,107 @@ class TestNetwork:
         with pytest.raises(ValueError, match="No path exists"):
             network.get_shortest_path("A", "B")
 
+    def test_shortest_path_cached_result_is_copy(self, sample_network):
+        """Test that repeated queries are not affected by mutating a result."""
+        path, _ = sample_network.get_shortest_path("A", "C")
+        path.append("Z")
+
+        path, length = sample_network.get_shortest_path("A", "C")
+        assert path == ["A", "B", "C"]
+        assert length == 25.0
+
+    def test_shortest_path_cache_cleared_on_add_edge(self, sample_network):
+        """Test that a cached path is recomputed after adding an edge."""
+        sample_network.get_shortest_path("A", "C")
+
+        sample_network.add_node(Node(id="D", name="Node D"))
+        sample_network.add_edge(Edge(source="A", target="D", weight=5.0))
+        sample_network.add_edge(Edge(source="D", target="C", weight=5.0))
+
+        path, length = sample_network.get_shortest_path("A", "C")
+        assert path == ["A", "D", "C"]
+        assert length == 10.0
+
+    def test_shortest_path_cache_separates_weights(self, sample_network):
+        """Test that cached paths are keyed by the weight attribute."""
+        weighted_path, _ = sample_network.get_shortest_path("A", "C")
+        hop_path, hops = sample_network.get_shortest_path("A", "C", weight=None)
+
+        assert weighted_path == ["A", "B", "C"]
+        assert hop_path == ["A", "C"]
+        assert hops == 1
+
+    def test_precompute_shortest_paths(self, sample_network):
+        """Test that precomputed paths match on-demand shortest paths."""
+        expected = {
+            (source, target): sample_network.get_shortest_path(source, target)
+            for source, target in [("A", "B"), ("A", "C"), ("B", "C"), ("A", "A")]
+        }
+
+        sample_network.precompute_shortest_paths()
+
+        for (source, target), result in expected.items():
+            assert sample_network.get_shortest_path(source, target) == result
+
+    def test_precompute_shortest_paths_breaks_ties_like_on_demand(self):
+        """Test that precomputed paths pick the same route between equal-length alternatives."""
+        def build():
+            network = Network()
+            network.add_nodes(Node(id=node_id, name=node_id) for node_id in "ABCD")
+            network.add_edges([
+                Edge(source="A", target="B", weight=2.0),
+                Edge(source="B", target="D", weight=1.0),
+                Edge(source="A", target="C", weight=1.0),
+                Edge(source="C", target="D", weight=2.0),
+            ])
+            return network
+
+        on_demand = build().get_shortest_path("A", "D")
+
+        network = build()
+        network.precompute_shortest_paths()
+
+        assert network.get_shortest_path("A", "D") == on_demand
+
+    def test_precompute_shortest_paths_unweighted(self, sample_network):
+        """Test that precomputing with weight=None caches hop-count paths."""
+        sample_network.precompute_shortest_paths(weight=None)
+
+        path, hops = sample_network.get_shortest_path("A", "C", weight=None)
+        assert path == ["A", "C"]
+        assert hops == 1
+
+    def test_precomputed_path_is_copy(self, sample_network):
+        """Test that mutating a returned path does not affect the cache."""
+        sample_network.precompute_shortest_paths()
+
+        path, _ = sample_network.get_shortest_path("A", "C")
+        path.append("Z")
+
+        path, _ = sample_network.get_shortest_path("A", "C")
+        assert path == ["A", "B", "C"]
+
+    def test_precomputed_paths_cleared_on_add_edge(self, sample_network):
+        """Test that adding an edge invalidates precomputed paths."""
+        sample_network.precompute_shortest_paths()
+        sample_network.add_node(Node(id="D", name="Node D"))
+        sample_network.add_edge(Edge(source="A", target="D", weight=5.0))
+        sample_network.add_edge(Edge(source="D", target="C", weight=5.0))
+
+        path, length = sample_network.get_shortest_path("A", "C")
+        assert path == ["A", "D", "C"]
+        assert length == 10.0
+
+    def test_precomputed_paths_no_path_raises_error(self):
+        """Test that unreachable pairs still raise after precomputation."""
+        network = Network()
+        network.add_node(Node(id="A", name="Node A"))
+        network.add_node(Node(id="B", name="Node B"))
+        network.precompute_shortest_paths()
+
+        with pytest.raises(ValueError, match="No path exists"):
+            network.get_shortest_path("A", "B")
+
     def test_get_all_paths(self, sample_network):
         """Test getting all simple paths."""
         paths = sample_network.get_all_paths("A", "C")
@@ -264,6 +421,14 @@ class TestNetwork:
         assert subgraph.get_node("B") is not None
         assert subgraph.get_node("C") is None
 
+    def test_get_subgraph_ignores_unknown_nodes(self, sample_network):
+        """Test subgraph extraction skips IDs that are not in the network."""
+        subgraph = sample_network.get_subgraph(["A", "C", "Z"])
+
+        assert subgraph.node_count == 2
+        assert subgraph.edge_count == 1  # Only A->C edge
+        assert subgraph.get_node("Z") is None
+
     def test_to_dict(self, sample_network):
         """Test network export to dictionary."""
         data = sample_network.to_dict()
@@ -17,9 +17,8 @@ from src.models.diffusion import MultiLevelAutomationDiffusion
 from src.config import DiffusionConfig
 
 
-# Set up output directory
+# Output directory (created by main)
 RESULTS_DIR = Path(__file__).parent.parent / "results"
-RESULTS_DIR.mkdir(exist_ok=True)
 
 # Color scheme for automation levels
 COLORS = {
@@ -31,6 +30,20 @@ COLORS = {
     "L5": "#9B59B6",  # Purple (full automation)
 }
 
+# Legend labels for automation levels
+LEVEL_LABELS = {
+    "L0": "L0 - Manual",
+    "L1": "L1 - Steering Assistance",
+    "L2": "L2 - Partial Automation",
+    "L3": "L3 - Conditional Automation",
+    "L4": "L4 - High Automation",
+    "L5": "L5 - Full Automation",
+}
+
+# Short subplot titles for automation levels, indexed by level number
+LEVEL_TITLES = ("L0 - Manual", "L1 - Steering", "L2 - Partial",
+                "L3 - Conditional", "L4 - High", "L5 - Full")
+
 SCENARIO_COLORS = {
     "baseline": "#3498DB",    # Blue
     "optimistic": "#2ECC71",  # Green
@@ -45,49 +58,69 @@ def run_model_from_config(config: DiffusionConfig) -> MultiLevelAutomationDiffus
     return model
 
 
+def run_scenarios(scenarios: dict) -> dict:
+    """Run each scenario once, returning models keyed by scenario name."""
+    return {name: run_model_from_config(config) for name, config in scenarios.items()}
+
+
 def calculate_L0(model: MultiLevelAutomationDiffusion) -> np.ndarray:
     """
     Calculate L0 (manual/non-adopters) vessels over time.
 
+    Shorthand for row 0 of level_histories(model); plots that need several
+    levels should call level_histories once instead.
+    """
+    return level_histories(model)[0]
+
+
+def level_histories(model: MultiLevelAutomationDiffusion) -> np.ndarray:
+    """
+    Snapshot the adoption histories of all levels as one array.
+
     In the mutually exclusive model, L0 represents vessels that have not adopted
     any automation level (L1-L5). Since each vessel belongs to exactly ONE level
     (L0, L1, L2, L3, L4, or L5), we calculate:
         L0 = total_fleet - (L1 + L2 + L3 + L4 + L5)
-    """
-    total_fleet = model.total_fleet
-    L1 = np.array(model.history_L1)
-    L2 = np.array(model.history_L2)
-    L3 = np.array(model.history_L3)
-    L4 = np.array(model.history_L4)
-    L5 = np.array(model.history_L5)
-    return total_fleet - (L1 + L2 + L3 + L4 + L5)
 
-
-def plot_1_multilevel_adoption_curves(config: DiffusionConfig, save_path: Path):
+    Returns:
+        Array of shape (6, steps + 1); row k holds level Lk.
+    """
+    adopters = np.array([
+        model.history_L1,
+        model.history_L2,
+        model.history_L3,
+        model.history_L4,
+        model.history_L5,
+    ])
+    return np.vstack([model.total_fleet - adopters.sum(axis=0), adopters])
+
+
+def plot_1_multilevel_adoption_curves(
+    config: DiffusionConfig,
+    save_path: Path,
+    model: MultiLevelAutomationDiffusion = None,
+):
     """
     Visualization 1: Multi-level adoption curves over time.
     Shows all 5 automation levels plus L0 baseline on one plot.
+    Pass an already-run model for config to skip re-running it.
     """
     print("Generating Visualization 1: Multi-level adoption curves...")
 
-    model = run_model_from_config(config)
+    if model is None:
+        model = run_model_from_config(config)
 
     t = np.array(model.history_time)
-    L0 = calculate_L0(model)
-    L1 = np.array(model.history_L1)
-    L2 = np.array(model.history_L2)
-    L3 = np.array(model.history_L3)
-    L4 = np.array(model.history_L4)
-    L5 = np.array(model.history_L5)
+    L0, L1, L2, L3, L4, L5 = level_histories(model)
 
     fig, ax = plt.subplots(figsize=(12, 7))
 
-    ax.plot(t, L0, label="L0 - Manual", color=COLORS["L0"], linewidth=2, linestyle="--")
-    ax.plot(t, L1, label="L1 - Steering Assistance", color=COLORS["L1"], linewidth=2.5)
-    ax.plot(t, L2, label="L2 - Partial Automation", color=COLORS["L2"], linewidth=2.5)
-    ax.plot(t, L3, label="L3 - Conditional Automation", color=COLORS["L3"], linewidth=2.5)
-    ax.plot(t, L4, label="L4 - High Automation", color=COLORS["L4"], linewidth=2.5)
-    ax.plot(t, L5, label="L5 - Full Automation", color=COLORS["L5"], linewidth=2.5)
+    ax.plot(t, L0, label=LEVEL_LABELS["L0"], color=COLORS["L0"], linewidth=2, linestyle="--")
+    ax.plot(t, L1, label=LEVEL_LABELS["L1"], color=COLORS["L1"], linewidth=2.5)
+    ax.plot(t, L2, label=LEVEL_LABELS["L2"], color=COLORS["L2"], linewidth=2.5)
+    ax.plot(t, L3, label=LEVEL_LABELS["L3"], color=COLORS["L3"], linewidth=2.5)
+    ax.plot(t, L4, label=LEVEL_LABELS["L4"], color=COLORS["L4"], linewidth=2.5)
+    ax.plot(t, L5, label=LEVEL_LABELS["L5"], color=COLORS["L5"], linewidth=2.5)
 
     ax.set_xlabel("Time (years)", fontsize=12)
     ax.set_ylabel("Number of Vessels", fontsize=12)
@@ -104,38 +137,37 @@ def plot_1_multilevel_adoption_curves(config: DiffusionConfig, save_path: Path):
     plt.close()
 
 
-def plot_2_scenario_comparison(scenarios: dict, save_path: Path):
+def plot_2_scenario_comparison(
+    scenarios: dict,
+    save_path: Path,
+    results: dict = None,
+):
     """
     Visualization 2: Scenario comparison.
     Overlays baseline/optimistic/pessimistic scenarios for each level.
+    Pass the models from run_scenarios(scenarios) as results to skip
+    re-running them.
     """
     print("Generating Visualization 2: Scenario comparison...")
 
-    # Run all scenarios
-    results = {}
-    for name, config in scenarios.items():
-        results[name] = run_model_from_config(config)
+    if results is None:
+        results = run_scenarios(scenarios)
+
+    # Snapshot each scenario's histories once rather than per subplot
+    histories = {name: level_histories(model) for name, model in results.items()}
 
     fig, axes = plt.subplots(2, 3, figsize=(18, 10))
     axes = axes.flatten()
 
-    level_names = ["L0 - Manual", "L1 - Steering", "L2 - Partial",
-                   "L3 - Conditional", "L4 - High", "L5 - Full"]
-
-    for idx, (level_num, level_name) in enumerate(zip([0, 1, 2, 3, 4, 5], level_names)):
-        ax = axes[idx]
+    for level_num, level_name in enumerate(LEVEL_TITLES):
+        ax = axes[level_num]
 
         for scenario_name, model in results.items():
             t = np.array(model.history_time)
 
-            if level_num == 0:
-                data = calculate_L0(model)
-            else:
-                data = np.array(getattr(model, f"history_L{level_num}"))
-
             ax.plot(
                 t,
-                data,
+                histories[scenario_name][level_num],
                 label=scenario_name.capitalize(),
                 color=SCENARIO_COLORS[scenario_name],
                 linewidth=2.5,
@@ -158,78 +190,44 @@ def plot_2_scenario_comparison(scenarios: dict, save_path: Path):
     plt.close()
 
 
-def plot_3_market_share_evolution(config: DiffusionConfig, save_path: Path):
+def plot_3_market_share_evolution(
+    config: DiffusionConfig,
+    save_path: Path,
+    model: MultiLevelAutomationDiffusion = None,
+):
     """
     Visualization 3: Market share evolution.
     Stacked area chart showing proportion of fleet at each automation level.
+    Pass an already-run model for config to skip re-running it.
     """
     print("Generating Visualization 3: Market share evolution...")
 
-    model = run_model_from_config(config)
+    if model is None:
+        model = run_model_from_config(config)
 
     t = np.array(model.history_time)
-    L0 = calculate_L0(model)
-    L1 = np.array(model.history_L1)
-    L2 = np.array(model.history_L2)
-    L3 = np.array(model.history_L3)
-    L4 = np.array(model.history_L4)
-    L5 = np.array(model.history_L5)
 
     # Calculate market shares (percentage) for mutually exclusive levels
     # In the mutually exclusive model, each level is independent, so shares are:
     # L0, L1, L2, L3, L4, L5 (not L1-L2, L2-L3, etc.)
-    total = model.total_fleet
-    share_L0 = (L0 / total) * 100
-    share_L1 = (L1 / total) * 100
-    share_L2 = (L2 / total) * 100
-    share_L3 = (L3 / total) * 100
-    share_L4 = (L4 / total) * 100
-    share_L5 = (L5 / total) * 100
+    shares = level_histories(model) / model.total_fleet * 100
+
+    # Band edges for the stacked areas: level k spans tops[k-1]..tops[k]
+    tops = np.cumsum(shares, axis=0)
+    bottoms = np.vstack([np.zeros_like(tops[0]), tops[:-1]])
 
     fig, ax = plt.subplots(figsize=(12, 7))
 
     # Stack the areas for mutually exclusive levels
-    ax.fill_between(t, 0, share_L0, label="L0 - Manual", color=COLORS["L0"], alpha=0.8)
-    ax.fill_between(
-        t,
-        share_L0,
-        share_L0 + share_L1,
-        label="L1 - Steering Assistance",
-        color=COLORS["L1"],
-        alpha=0.8,
-    )
-    ax.fill_between(
-        t,
-        share_L0 + share_L1,
-        share_L0 + share_L1 + share_L2,
-        label="L2 - Partial Automation",
-        color=COLORS["L2"],
-        alpha=0.8,
-    )
-    ax.fill_between(
-        t,
-        share_L0 + share_L1 + share_L2,
-        share_L0 + share_L1 + share_L2 + share_L3,
-        label="L3 - Conditional Automation",
-        color=COLORS["L3"],
-        alpha=0.8,
-    )
-    ax.fill_between(
-        t,
-        share_L0 + share_L1 + share_L2 + share_L3,
-        share_L0 + share_L1 + share_L2 + share_L3 + share_L4,
-        label="L4 - High Automation",
-        color=COLORS["L4"],
-        alpha=0.8,
-    )
-    ax.fill_between(
-        t,
-        share_L0 + share_L1 + share_L2 + share_L3 + share_L4,
-        share_L0 + share_L1 + share_L2 + share_L3 + share_L4 + share_L5,
-        label="L5 - Full Automation",
-        color=COLORS["L5"],
-        alpha=0.8,
-    )
+    for level_num, level in enumerate(LEVEL_LABELS):
+        ax.fill_between(
+            t,
+            bottoms[level_num],
+            tops[level_num],
+            label=LEVEL_LABELS[level],
+            color=COLORS[level],
+            alpha=0.8,
+        )
 
     ax.set_xlabel("Time (years)", fontsize=12)
     ax.set_ylabel("Market Share (%)", fontsize=12)
@@ -248,39 +246,35 @@ def plot_3_market_share_evolution(config: DiffusionConfig, save_path: Path):
     plt.close()
 
 
-def plot_4_uncertainty_bands(scenarios: dict, save_path: Path):
+def plot_4_uncertainty_bands(
+    scenarios: dict,
+    save_path: Path,
+    results: dict = None,
+):
     """
     Visualization 4: Uncertainty bands.
     Shows range across scenarios for each automation level.
+    Pass the models from run_scenarios(scenarios) as results to skip
+    re-running them.
     """
     print("Generating Visualization 4: Uncertainty bands...")
 
-    # Run all scenarios
-    results = {}
-    for name, config in scenarios.items():
-        results[name] = run_model_from_config(config)
+    if results is None:
+        results = run_scenarios(scenarios)
+
+    # Snapshot each scenario's histories once rather than per subplot
+    histories = {name: level_histories(model) for name, model in results.items()}
+    t = np.array(results["baseline"].history_time)
 
     fig, axes = plt.subplots(2, 3, figsize=(18, 10))
     axes = axes.flatten()
 
-    level_names = ["L0 - Manual", "L1 - Steering", "L2 - Partial",
-                   "L3 - Conditional", "L4 - High", "L5 - Full"]
-
-    for idx, (level_num, level_name) in enumerate(zip([0, 1, 2, 3, 4, 5], level_names)):
-        ax = axes[idx]
+    for level_num, level_name in enumerate(LEVEL_TITLES):
+        ax = axes[level_num]
 
-        # Get baseline data
-        baseline_model = results["baseline"]
-        t = np.array(baseline_model.history_time)
-
-        if level_num == 0:
-            baseline_data = calculate_L0(baseline_model)
-            optimistic_data = calculate_L0(results["optimistic"])
-            pessimistic_data = calculate_L0(results["pessimistic"])
-        else:
-            baseline_data = np.array(getattr(baseline_model, f"history_L{level_num}"))
-            optimistic_data = np.array(getattr(results["optimistic"], f"history_L{level_num}"))
-            pessimistic_data = np.array(getattr(results["pessimistic"], f"history_L{level_num}"))
+        baseline_data = histories["baseline"][level_num]
+        optimistic_data = histories["optimistic"][level_num]
+        pessimistic_data = histories["pessimistic"][level_num]
 
         # Plot baseline
         ax.plot(t, baseline_data, label="Baseline", color=SCENARIO_COLORS["baseline"], linewidth=2.5)
@@ -395,6 +389,8 @@ def main():
     print("=" * 70)
     print()
 
+    RESULTS_DIR.mkdir(exist_ok=True)
+
     # Load scenarios
     scenarios = DiffusionConfig.get_all_scenarios()
     baseline = scenarios["baseline"]
@@ -403,28 +399,35 @@ def main():
     print(baseline.summary())
     print()
 
+    # Run each scenario once and share the results between plots
+    results = run_scenarios(scenarios)
+
     # Generate all visualizations
     print("Generating visualizations...")
     print("-" * 70)
 
     plot_1_multilevel_adoption_curves(
         baseline,
-        RESULTS_DIR / "1_multilevel_adoption_curves.png"
+        RESULTS_DIR / "1_multilevel_adoption_curves.png",
+        model=results["baseline"]
     )
 
     plot_2_scenario_comparison(
         scenarios,
-        RESULTS_DIR / "2_scenario_comparison.png"
+        RESULTS_DIR / "2_scenario_comparison.png",
+        results=results
     )
 
     plot_3_market_share_evolution(
         baseline,
-        RESULTS_DIR / "3_market_share_evolution.png"
+        RESULTS_DIR / "3_market_share_evolution.png",
+        model=results["baseline"]
     )
 
     plot_4_uncertainty_bands(
         scenarios,
-        RESULTS_DIR / "4_uncertainty_bands.png"
+        RESULTS_DIR / "4_uncertainty_bands.png",
+        results=results
     )
 
     plot_5_sensitivity_analysis(
@@ -440,4 +443,8 @@ def main():
 
 
 if __name__ == "__main__":
+    import matplotlib
+
+    # Figures are only saved to disk, so skip interactive backend setup
+    matplotlib.use("Agg")
     main()